@@ -0,0 +1,81 @@
+"""流式 xml 解析与 xmltodict 整体解析的对比。
+
+    python -m benchmarks.bench_xml [-n 3600]
+
+内存为 tracemalloc 记录的 Python 分配峰值（文本、字典树和行批次），
+Polars 在 Rust 侧的分配不计入。
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import polars as pl
+import xmltodict
+
+from that_game._loader import _flatten_structs, _load_xml
+
+from .generate import sportec_events_xml
+
+ROOT = "PutDataRequest.Event"
+
+
+def _load_xmltodict(path: Path) -> pl.DataFrame:
+    data: Any = xmltodict.parse(path.read_text())
+    for key in ROOT.split("."):
+        data = data[key]
+    return _flatten_structs(pl.DataFrame(data, infer_schema_length=None))
+
+
+def _load_stream(path: Path) -> pl.DataFrame:
+    return _load_xml(path, ROOT)
+
+
+def _measure(
+    func: Callable[[Path], pl.DataFrame], path: Path, repeat: int
+) -> tuple[float, int, pl.DataFrame]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = func(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--n-events", type=int, default=3600)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "events.xml"
+        path.write_text(sportec_events_xml(args.n_events))
+        size = path.stat().st_size / 2**20
+        print(f"sportec events: {args.n_events} events, {size:.1f} MiB")
+
+        results = {}
+        for name, func in (
+            ("xmltodict", _load_xmltodict),
+            ("stream", _load_stream),
+        ):
+            seconds, peak, df = _measure(func, path, args.repeat)
+            results[name] = df
+            print(
+                f"{name:>10}: {seconds * 1000:8.1f} ms  "
+                f"peak {peak / 2**20:7.1f} MiB  shape {df.shape}"
+            )
+
+        assert results["xmltodict"].equals(results["stream"])
+
+
+if __name__ == "__main__":
+    main()
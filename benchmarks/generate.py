@@ -0,0 +1,105 @@
+"""生成确定性的合成比赛数据，用于 benchmark。
+
+    python -m benchmarks.generate sportec-events -o match.xml
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+from xml.sax.saxutils import quoteattr
+
+_SPORTEC_PLAYS = (
+    ("Play", "Pass"),
+    ("Play", "Cross"),
+    ("TacklingGame", None),
+    ("BallClaiming", None),
+    ("OtherBallAction", None),
+    ("Foul", None),
+    ("ShotAtGoal", "SavedShot"),
+    ("ShotAtGoal", "ShotWide"),
+    ("FreeKick", "Play"),
+    ("ThrowIn", "Play"),
+    ("CornerKick", "Play"),
+    ("Substitution", None),
+)
+
+
+def _attrs(values: dict[str, object]) -> str:
+    return " ".join(f"{k}={quoteattr(str(v))}" for k, v in values.items())
+
+
+def sportec_events_xml(n_events: int = 1800, seed: int = 0) -> str:
+    """一场 Sportec (DFL) 事件数据，结构与公开的 events_raw xml 一致。"""
+    rng = random.Random(seed)
+    kickoff = datetime.fromisoformat("2023-05-27T15:30:00.000+02:00")
+    half = max(n_events // 2, 1)
+    lines = ['<?xml version="1.0" encoding="utf-8"?>', "<PutDataRequest>"]
+
+    for i in range(n_events):
+        section = "firstHalf" if i < half else "secondHalf"
+        start = kickoff if i < half else kickoff + timedelta(minutes=62)
+        offset = (i % half) * (47 * 60 / half) + rng.random()
+        event_time = start + timedelta(seconds=offset)
+        event = {
+            "EventId": 10_000_000 + i,
+            "EventTime": event_time.isoformat(timespec="milliseconds"),
+            "MatchId": "DFL-MAT-000001",
+            "CompetitionId": "DFL-COM-000001",
+            "SeasonId": "DFL-SEA-0001K7",
+            "X": round(rng.uniform(0, 105), 2),
+            "Y": round(rng.uniform(0, 68), 2),
+        }
+        team = rng.choice(("DFL-CLU-000001", "DFL-CLU-000002"))
+        player = f"DFL-OBJ-{rng.randrange(100_000):06d}"
+        lines.append(f"  <Event {_attrs(event)}>")
+
+        if i in (0, half):
+            kick = {"GameSection": section, "Team": team, "Player": player}
+            lines.append(f"    <KickOff {_attrs(kick)}>")
+            lines.append(
+                f'      <Play {_attrs({"Team": team, "Player": player})}>'
+            )
+            lines.append("        <Pass />")
+            lines.append("      </Play>")
+            lines.append("    </KickOff>")
+        else:
+            name, sub = rng.choice(_SPORTEC_PLAYS)
+            attrs = {
+                "Team": team,
+                "Player": player,
+                "Evaluation": rng.choice(
+                    ("successfullyCompleted", "unsuccessful")
+                ),
+            }
+            if sub is None:
+                lines.append(f"    <{name} {_attrs(attrs)} />")
+            else:
+                lines.append(f"    <{name} {_attrs(attrs)}>")
+                lines.append(f"      <{sub} />")
+                lines.append(f"    </{name}>")
+        lines.append("  </Event>")
+
+    lines.append("</PutDataRequest>")
+    return "\n".join(lines) + "\n"
+
+
+_GENERATORS = {
+    "sportec-events": sportec_events_xml,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("kind", choices=sorted(_GENERATORS))
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("-n", "--n-events", type=int, default=1800)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    text = _GENERATORS[args.kind](args.n_events, args.seed)
+    with open(args.output, "w") as f:
+        f.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 from . import expression, providers
+from ._cache import Cache
 from ._loader import load_events, load_tracking
 from ._models import Events, Records, Tracking
 from ._providers.base import Provider
 
 __all__ = (
+    "Cache",
     "Events",
     "Records",
     "Tracking",
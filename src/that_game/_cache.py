@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+
+from ._providers.base import Provider
+
+try:
+    _VERSION = version("that-game")
+except PackageNotFoundError:
+    _VERSION = "0"
+
+_SUFFIX = ".arrow"
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _provider_fingerprint(provider: Provider) -> str:
+    preprocess = provider.preprocess
+    definition = [
+        provider.name,
+        provider.data_type,
+        provider.root,
+        sorted(provider.field_aliases.items()),
+        None
+        if preprocess is None
+        else f"{preprocess.__module__}.{preprocess.__qualname__}",
+    ]
+    return json.dumps(definition, default=str)
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Cache:
+    """预处理结果的磁盘缓存。
+
+    以 Arrow IPC（不压缩）保存展开和预处理之后的 DataFrame，
+    再次加载时直接内存映射。key 由源文件路径、修改时间和大小
+    （或内容哈希）、provider 定义以及库版本组成；
+    总大小超过 max_bytes 时按最近访问时间淘汰。
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 1 << 30,
+        hash_content: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hash_content = hash_content
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _entry(self, path: Path, provider: Provider) -> Path:
+        if self.hash_content:
+            source = _file_digest(path)
+        else:
+            stat = path.stat()
+            source = [str(path.resolve()), stat.st_mtime_ns, stat.st_size]
+        key = json.dumps([source, _provider_fingerprint(provider), _VERSION])
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self.directory / f"{provider.name}-{digest}{_SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        return list(self.directory.glob(f"*{_SUFFIX}"))
+
+    def load(
+        self,
+        path: Path,
+        provider: Provider,
+        loader: Callable[[], pl.DataFrame],
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        entry = self._entry(path, provider)
+        if entry.is_file():
+            # 用修改时间记录最近访问，淘汰时据此排序
+            os.utime(entry)
+        else:
+            self._write(entry, loader())
+
+        if lazy:
+            return pl.scan_ipc(entry, memory_map=True)
+        return pl.read_ipc(entry, memory_map=True)
+
+    def _write(self, entry: Path, df: pl.DataFrame) -> None:
+        # 先写临时文件再替换，避免其他进程读到写了一半的文件
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        df.write_ipc(tmp, compression="uncompressed")
+        os.replace(tmp, entry)
+        self._evict(keep=entry)
+
+    def _evict(self, keep: Path) -> None:
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def invalidate(self, provider: Provider | None = None) -> int:
+        """删除缓存条目，provider 为 None 时清空整个缓存。
+
+        provider 的定义改变后（例如修改了 preprocess 的实现），
+        用它来丢弃该 provider 旧的结果。
+        """
+        pattern = "*" if provider is None else f"{provider.name}-*"
+        removed = 0
+        for entry in self.directory.glob(f"{pattern}{_SUFFIX}"):
+            entry.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    @property
+    def size(self) -> int:
+        return sum(entry.stat().st_size for entry in self._entries())
@@ -1,35 +1,45 @@
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import polars as pl
 import xmltodict
 
+from ._cache import Cache
 from ._models import Events, Tracking
-from ._providers.base import Provider
+from ._providers.base import FrameT, Provider
 
 _INLINE_TEXT_LIMIT = 4096
+_XML_BATCH_SIZE = 10_000
 
 
-def _read_text_if_path(source: Any) -> str:
+def _source_path(source: Any) -> Path | None:
     if isinstance(source, Path):
-        return source.read_text()
-    if isinstance(source, str):
-        if len(source) > _INLINE_TEXT_LIMIT:
-            return source
+        return source
+    if isinstance(source, str) and len(source) <= _INLINE_TEXT_LIMIT:
         path = Path(source)
         if path.is_file():
-            return path.read_text()
-        return source
-    raise ValueError(f"Unsupported input type: {type(source)}")
+            return path
+    return None
+
+
+def _read_text_if_path(source: Any) -> str:
+    if not isinstance(source, (str, Path)):
+        raise ValueError(f"Unsupported input type: {type(source)}")
+    path = _source_path(source)
+    if path is not None:
+        return path.read_text()
+    return source
 
 
-def _flatten_structs(df: pl.DataFrame, separator: str = ".") -> pl.DataFrame:
-    struct_cols = [n for n, d in df.schema.items() if isinstance(d, pl.Struct)]
+def _flatten_structs(df: FrameT, separator: str = ".") -> FrameT:
+    schema = df.collect_schema()
+    struct_cols = [n for n, d in schema.items() if isinstance(d, pl.Struct)]
     if not struct_cols:
         return df
 
     exprs = []
-    for col_name, dtype in df.schema.items():
+    for col_name, dtype in schema.items():
         if isinstance(dtype, pl.Struct):
             for field in dtype.fields:
                 exprs.append(
@@ -43,51 +53,129 @@ def _flatten_structs(df: pl.DataFrame, separator: str = ".") -> pl.DataFrame:
     return _flatten_structs(df.select(exprs), separator)
 
 
-def _get_nested_value(
-    data: dict[str, Any],
-    target: str,
-    separator: str = ".",
-) -> Any:
-    # 暂时采用硬编码
-    current: Any = data
-    for key in target.split(separator):
-        if not isinstance(current, dict):
-            return None
-        current = current.get(key)
-    return current
+def _open_if_path(source: Any) -> AbstractContextManager[IO[bytes] | str]:
+    # 文件按流读取，字符串本身就是 xml 文本
+    path = _source_path(source)
+    if path is not None:
+        return path.open("rb")
+    return nullcontext(_read_text_if_path(source))
 
 
-def _load_xml(source: Any, root: str) -> pl.DataFrame:
-    # 以后为了性能，可以考虑使用 lxml 优化
-    text = _read_text_if_path(source)
-    data = xmltodict.parse(text)
+def _flatten_value(
+    value: dict[str, Any], row: dict[str, Any], prefix: str = ""
+) -> None:
+    for key, item in value.items():
+        if isinstance(item, dict):
+            _flatten_value(item, row, f"{prefix}{key}.")
+        else:
+            row[f"{prefix}{key}"] = item
+
+
+def _tree_columns(columns: list[str], drop: set[str]) -> list[str]:
+    # 按列名第一次出现的顺序重建层级，
+    # 使列顺序与 xmltodict + pl.DataFrame + _flatten_structs 的结果一致
+    tree: dict[str, Any] = {}
+    for column in columns:
+        node = tree
+        for key in column.split("."):
+            node = node.setdefault(key, {})
+
+    exists = set(columns) - drop
+    ordered: list[str] = []
+
+    def walk(node: dict[str, Any], prefix: str) -> None:
+        for key, child in node.items():
+            name = f"{prefix}{key}"
+            if name in exists:
+                ordered.append(name)
+            walk(child, f"{name}.")
+
+    walk(tree, "")
+    return ordered
+
+
+def _load_xml(
+    source: Any, root: str, batch_size: int = _XML_BATCH_SIZE
+) -> pl.DataFrame:
+    """流式解析 xml：只有 root 路径下的元素会被逐个交给回调展开成行，
+    每满一个批次就构建一个 DataFrame，
+    不再同时持有整个文本、完整的字典树和最终的 DataFrame。
+    """
+    path = root.split(".") if root != "." else []
+    rows: list[dict[str, Any]] = []
+    batches: list[pl.DataFrame] = []
+
+    def flush() -> None:
+        if rows:
+            batches.append(pl.from_dicts(rows, infer_schema_length=None))
+            rows.clear()
+
+    def on_item(item_path: list[tuple[str, Any]], item: Any) -> bool:
+        if [name for name, _ in item_path] == path:
+            row: dict[str, Any] = {}
+            if isinstance(item, dict):
+                _flatten_value(item, row)
+            else:
+                row["#text"] = item
+            rows.append(row)
+            if len(rows) >= batch_size:
+                flush()
+        return True
+
+    with _open_if_path(source) as xml_input:
+        if path:
+            xmltodict.parse(
+                xml_input, item_depth=len(path), item_callback=on_item
+            )
+        else:
+            on_item([], xmltodict.parse(xml_input))
+    flush()
 
-    # 是否需要预处理
-    # xml 需要的数据可能不在头部，需要向下获取
-    if root != ".":
-        data = _get_nested_value(data, root)
+    if not batches:
+        return pl.DataFrame()
+    df = pl.concat(batches, how="diagonal_relaxed")
 
-    return pl.DataFrame(data, infer_schema_length=None)
+    # 某个元素在部分行里为空、在其他行里有子元素时，
+    # 整体解析会得到一个 struct 列，这里对应地丢弃全空的父列
+    null_parents = {
+        c
+        for c, dtype in df.schema.items()
+        if dtype == pl.Null
+        and any(other.startswith(f"{c}.") for other in df.columns)
+    }
+    return df.select(_tree_columns(df.columns, null_parents))
 
 
-def _load_df(source: Any, provider: Provider) -> pl.DataFrame:
+def _read_df(source: Any, provider: Provider) -> pl.DataFrame:
     if isinstance(source, (list, dict)):
-        df = pl.DataFrame(source, infer_schema_length=None)
-    else:
+        return pl.DataFrame(source, infer_schema_length=None)
+
+    match provider.data_type:
+        case "json":
+            return pl.read_json(source, infer_schema_length=None)
+        case "jsonl":
+            return pl.read_ndjson(source, infer_schema_length=None)
+        case "csv":
+            return pl.read_csv(source, infer_schema_length=None)
+        case "xml":
+            return _load_xml(source, provider.root)
+        case _:
+            raise ValueError(f"Unsupported data type: {provider.data_type}")
+
+
+def _scan_source(source: Any, provider: Provider) -> pl.LazyFrame:
+    # json 和 xml 没有 scan 接口，只能先读入再转为 LazyFrame，
+    # 但后续的展开、预处理和 filter 仍然会合并进同一个查询计划
+    if not isinstance(source, (list, dict)):
         match provider.data_type:
-            case "json":
-                df = pl.read_json(source, infer_schema_length=None)
             case "jsonl":
-                df = pl.read_ndjson(source, infer_schema_length=None)
+                return pl.scan_ndjson(source, infer_schema_length=None)
             case "csv":
-                df = pl.read_csv(source, infer_schema_length=None)
-            case "xml":
-                df = _load_xml(source, provider.root)
-            case _:
-                raise ValueError(
-                    f"Unsupported data type: {provider.data_type}"
-                )
+                return pl.scan_csv(source, infer_schema_length=None)
+    return _read_df(source, provider).lazy()
+
 
+def _prepare(df: FrameT, provider: Provider) -> FrameT:
     df = _flatten_structs(df)
 
     if provider.preprocess is not None:
@@ -95,11 +183,45 @@ def _load_df(source: Any, provider: Provider) -> pl.DataFrame:
     return df
 
 
-def load_events(source: Any, provider: Provider) -> Events:
-    df = _load_df(source, provider)
+def _load_df(source: Any, provider: Provider) -> pl.DataFrame:
+    return _prepare(_read_df(source, provider), provider)
+
+
+def _scan_df(source: Any, provider: Provider) -> pl.LazyFrame:
+    return _prepare(_scan_source(source, provider), provider)
+
+
+def _load_frame(
+    source: Any, provider: Provider, lazy: bool, cache: Cache | None
+) -> pl.DataFrame | pl.LazyFrame:
+    # 只有文件来源可以缓存，内存中的数据直接加载
+    path = _source_path(source)
+    if cache is not None and path is not None:
+        return cache.load(
+            path, provider, lambda: _load_df(source, provider), lazy=lazy
+        )
+    if lazy:
+        return _scan_df(source, provider)
+    return _load_df(source, provider)
+
+
+def load_events(
+    source: Any,
+    provider: Provider,
+    *,
+    lazy: bool = False,
+    cache: Cache | None = None,
+) -> Events:
+    df = _load_frame(source, provider, lazy, cache)
     return Events(df, provider)
 
 
-def load_tracking(source: Any, provider: Provider) -> Tracking:
-    df = _load_df(source, provider)
+def load_tracking(
+    source: Any,
+    provider: Provider,
+    *,
+    lazy: bool = False,
+    cache: Cache | None = None,
+) -> Tracking:
+    df = _load_frame(source, provider, lazy, cache)
     return Tracking(df, provider)
@@ -37,19 +37,47 @@ def _to_nested_dicts(
     return nested_items
 
 
+def _collect(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    if isinstance(df, pl.LazyFrame):
+        return df.collect()
+    return df
+
+
 def _drop_null_and_extra(df: pl.DataFrame) -> pl.DataFrame:
     null_cols = [c for c in df.columns if df[c].null_count() == df.height]
     return df.drop(null_cols, f"^{ExtraNames._PREFIX}.*$")
 
 
 class Records:
-    def __init__(self, data: pl.DataFrame, provider: Provider) -> None:
-        self.data = data
+    def __init__(
+        self, data: pl.DataFrame | pl.LazyFrame, provider: Provider
+    ) -> None:
+        # lazy 模式下保存 LazyFrame，直到第一次需要数据时才 collect
+        self._data = data
         self.provider = provider
         self.aliases = self.provider.field_aliases
 
     def __len__(self) -> int:
-        return len(self.data)
+        if isinstance(self._data, pl.LazyFrame):
+            return self._data.select(pl.len()).collect().item()
+        return len(self._data)
+
+    @property
+    def data(self) -> pl.DataFrame:
+        self._data = _collect(self._data)
+        return self._data
+
+    @property
+    def lazy(self) -> bool:
+        return isinstance(self._data, pl.LazyFrame)
+
+    @property
+    def schema(self) -> pl.Schema:
+        return self._data.collect_schema()
+
+    def collect(self) -> Self:
+        self._data = _collect(self._data)
+        return self
 
     @property
     def alias_keys(self) -> list[str]:
@@ -75,17 +103,18 @@ class Records:
             column_name = self.aliases.get(key, key)
             column = pl.col(column_name)
             if isinstance(value, FilterExpression):
-                dtype = self.data.schema[column_name]
+                dtype = self.schema[column_name]
                 mask &= value.build(column, dtype)
             else:
                 mask &= column == value
-        data = self.data.filter(mask)
+        data = self._data.filter(mask)
 
         if drop_null_columns:
-            data = _drop_null_and_extra(data)
+            data = _drop_null_and_extra(_collect(data))
 
         records = type(self)(data, self.provider)
-        if len(records) < 1:
+        # lazy 模式下只组合查询计划，空结果不在这里检查
+        if not records.lazy and len(records) < 1:
             raise ValueError(f"No records found for criteria: {kwargs}")
         return records
 
@@ -93,7 +122,9 @@ class Records:
 class Events(Records):
     @property
     def types(self) -> list[str]:
-        values = self.data[self.aliases["type"]].unique().to_list()
+        column = self.aliases["type"]
+        unique = _collect(self._data.select(pl.col(column).unique()))
+        values = unique[column].to_list()
         return sorted(values, key=lambda x: (x is None, x))
 
 
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Callable, Literal
+from typing import Literal, Protocol, TypeVar
 
 import polars as pl
 
@@ -13,6 +13,14 @@ PERIOD_MINUTES = {
 }
 
 
+# 预处理既可以作用于 DataFrame，也可以作用于 LazyFrame（lazy 模式）
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+
+class Preprocess(Protocol):
+    def __call__(self, df: FrameT, /) -> FrameT: ...
+
+
 class ExtraNames:
     _PREFIX = "std_"
 
@@ -26,7 +34,8 @@ class ExtraNames:
 
 @dataclass(kw_only=True, frozen=True, slots=True)
 class Provider:
+    name: str = ""
     data_type: Literal["csv", "xml", "json", "jsonl"]
     root: str = "."
-    preprocess: Callable[[pl.DataFrame], pl.DataFrame] | None = None
+    preprocess: Preprocess | None = None
     field_aliases: dict[str, str]
@@ -1,9 +1,15 @@
 import polars as pl
 
-from .base import NAME_SEPARATOR, PERIOD_MINUTES, ExtraNames, Provider
+from .base import (
+    NAME_SEPARATOR,
+    PERIOD_MINUTES,
+    ExtraNames,
+    FrameT,
+    Provider,
+)
 
 
-def _add_type(df: pl.DataFrame) -> pl.DataFrame:
+def _add_type(df: FrameT) -> FrameT:
     """将 SkillCorner 分散的事件类型字段合并为统一的 type_name 列。
 
     1. 首先通过 concat_list 将所有可能包含事件类型信息的列合并成一个列表列。
@@ -18,7 +24,7 @@ def _add_type(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _add_full_time(df: pl.DataFrame) -> pl.DataFrame:
+def _add_full_time(df: FrameT) -> FrameT:
     return df.with_columns(
         (
             (
@@ -37,7 +43,7 @@ def _add_full_time(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _add_time(df: pl.DataFrame) -> pl.DataFrame:
+def _add_time(df: FrameT) -> FrameT:
     return df.with_columns(
         (
             pl.col("std_full_time")
@@ -49,17 +55,18 @@ def _add_time(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _add_clock(df: pl.DataFrame) -> pl.DataFrame:
+def _add_clock(df: FrameT) -> FrameT:
     return _add_time(_add_full_time(df))
 
 
-def _preprocess(df: pl.DataFrame) -> pl.DataFrame:
+def _preprocess(df: FrameT) -> FrameT:
     df = _add_type(df)
     df = _add_clock(df)
     return df
 
 
 skillcorner = Provider(
+    name="skillcorner",
     data_type="csv",
     preprocess=_preprocess,
     field_aliases={
@@ -1,9 +1,15 @@
 import polars as pl
 
-from .base import NAME_SEPARATOR, PERIOD_MINUTES, ExtraNames, Provider
+from .base import (
+    NAME_SEPARATOR,
+    PERIOD_MINUTES,
+    ExtraNames,
+    FrameT,
+    Provider,
+)
 
 
-def _add_type(df: pl.DataFrame) -> pl.DataFrame:
+def _add_type(df: FrameT) -> FrameT:
     """Sportec 的事件数据中，事件类型信息分散在多个列中
     （例如 type.name, subType.name 等），需要合并成一个统一的 type_name 列。
 
@@ -15,7 +21,7 @@ def _add_type(df: pl.DataFrame) -> pl.DataFrame:
     去除以 "@" 开头的字符串和空字符串，并保持唯一性。
     4. 最后通过 list.join 将剩余的元素用 ";" 连接起来，形成最终的 type 列
     """
-    type_cols = df.columns[7:]
+    type_cols = df.collect_schema().names()[7:]
 
     return df.with_columns(
         pl.concat_list(
@@ -55,7 +61,7 @@ _period_mapping = {
 }
 
 
-def _add_period(df: pl.DataFrame) -> pl.DataFrame:
+def _add_period(df: FrameT) -> FrameT:
     # 1. 先获取 period，后续时间标准化都依赖它
     return df.with_columns(
         pl.col("KickOff.@GameSection")
@@ -66,7 +72,7 @@ def _add_period(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _add_time(df: pl.DataFrame) -> pl.DataFrame:
+def _add_time(df: FrameT) -> FrameT:
     _event_time_expr = pl.col("@EventTime").str.to_datetime(
         format="%Y-%m-%dT%H:%M:%S%.f%:z"
     )
@@ -78,7 +84,7 @@ def _add_time(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _add_full_time(df: pl.DataFrame) -> pl.DataFrame:
+def _add_full_time(df: FrameT) -> FrameT:
     return df.with_columns(
         # 3. full_time = period 起始分钟 + period 内相对时间
         (
@@ -92,16 +98,17 @@ def _add_full_time(df: pl.DataFrame) -> pl.DataFrame:
         ).alias(ExtraNames.FULL_TIME),
     )
 
-def _add_clock(df: pl.DataFrame) -> pl.DataFrame:
+def _add_clock(df: FrameT) -> FrameT:
     return _add_full_time(_add_time(_add_period(df)))
 
-def _preprocess(df: pl.DataFrame) -> pl.DataFrame:
+def _preprocess(df: FrameT) -> FrameT:
     df = _add_type(df)
     df = _add_clock(df)
     return df
 
 
 sportec = Provider(
+    name="sportec",
     data_type="xml",
     root="PutDataRequest.Event",
     preprocess=_preprocess,
@@ -1,9 +1,9 @@
 import polars as pl
 
-from .base import PERIOD_MINUTES, ExtraNames, Provider
+from .base import PERIOD_MINUTES, ExtraNames, FrameT, Provider
 
 
-def _add_time(df: pl.DataFrame) -> pl.DataFrame:
+def _add_time(df: FrameT) -> FrameT:
     return df.with_columns(
         (
             pl.col("timestamp").str.to_time(
@@ -16,7 +16,7 @@ def _add_time(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _add_full_time(df: pl.DataFrame) -> pl.DataFrame:
+def _add_full_time(df: FrameT) -> FrameT:
     # 3. full_time = period 起始分钟 + period 内相对时间
     return df.with_columns(
         (
@@ -29,16 +29,17 @@ def _add_full_time(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _add_clock(df: pl.DataFrame) -> pl.DataFrame:
+def _add_clock(df: FrameT) -> FrameT:
     return _add_full_time(_add_time(df))
 
 
-def _preprocess(df: pl.DataFrame) -> pl.DataFrame:
+def _preprocess(df: FrameT) -> FrameT:
     df = _add_clock(df)
     return df
 
 
 statsbomb = Provider(
+    name="statsbomb",
     data_type="json",
     root=".",
     field_aliases={
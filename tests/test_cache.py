@@ -0,0 +1,86 @@
+import os
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from that_game import Cache, Provider, load_events
+
+DATA_PATH = Path.cwd() / "tests/data/load"
+
+
+def _preprocess(df: pl.DataFrame) -> pl.DataFrame:
+    return df.with_columns((pl.col("x") * 2).alias("std_x"))
+
+
+PROVIDER = Provider(
+    name="sample",
+    data_type="csv",
+    preprocess=_preprocess,
+    field_aliases={"type": "type.name"},
+)
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "events.csv"
+    path.write_bytes((DATA_PATH / "sample.csv").read_bytes())
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Cache:
+    return Cache(tmp_path / "cache")
+
+
+def test_hit(source: Path, cache: Cache) -> None:
+    events = load_events(source, PROVIDER, cache=cache)
+    assert events.data["std_x"].to_list() == [20, 40]
+    entries = list(cache.directory.iterdir())
+    assert len(entries) == 1
+
+    cached = load_events(source, PROVIDER, cache=cache)
+    assert cached.data.equals(events.data)
+    assert list(cache.directory.iterdir()) == entries
+
+
+def test_lazy(source: Path, cache: Cache) -> None:
+    load_events(source, PROVIDER, cache=cache)
+    events = load_events(source, PROVIDER, lazy=True, cache=cache)
+    assert events.lazy
+    assert events.filter(type="Pass").to_dict()[0]["x"] == 20
+
+
+def test_source_changed(source: Path, cache: Cache) -> None:
+    load_events(source, PROVIDER, cache=cache)
+    source.write_text("id,type.name,x\nevent-3,Shot,30\n")
+    events = load_events(source, PROVIDER, cache=cache)
+    assert events.data["x"].to_list() == [30]
+    assert len(list(cache.directory.iterdir())) == 2
+
+
+def test_hash_content(source: Path, tmp_path: Path) -> None:
+    cache = Cache(tmp_path / "cache", hash_content=True)
+    load_events(source, PROVIDER, cache=cache)
+    os.utime(source, ns=(0, 0))
+    load_events(source, PROVIDER, cache=cache)
+    assert len(list(cache.directory.iterdir())) == 1
+
+
+def test_evict(tmp_path: Path, source: Path) -> None:
+    cache = Cache(tmp_path / "cache", max_bytes=1)
+    load_events(source, PROVIDER, cache=cache)
+    other = tmp_path / "other.csv"
+    other.write_text("id,type.name,x\nevent-3,Shot,30\n")
+    load_events(other, PROVIDER, cache=cache)
+    # 超出上限时只保留最近写入的条目
+    assert len(list(cache.directory.iterdir())) == 1
+    assert load_events(other, PROVIDER, cache=cache).data["x"][0] == 30
+
+
+def test_invalidate(source: Path, cache: Cache) -> None:
+    load_events(source, PROVIDER, cache=cache)
+    other = Provider(name="other", data_type="csv", field_aliases={})
+    assert cache.invalidate(other) == 0
+    assert cache.invalidate(PROVIDER) == 1
+    assert cache.size == 0
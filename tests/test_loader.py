@@ -6,11 +6,19 @@ from pathlib import Path
 
 import polars as pl
 import pytest
+import xmltodict
 
-from that_game._loader import _flatten_structs, _load_xml, _read_text_if_path
+from that_game import Provider
+from that_game._loader import (
+    _flatten_structs,
+    _load_xml,
+    _read_text_if_path,
+    _scan_df,
+)
 
 DATA_PATH = Path.cwd() / "tests/data/load"
 XML_FILE = DATA_PATH / "sample.xml"
+CSV_FILE = DATA_PATH / "sample.csv"
 XML_STR = """
 <root>
   <events>
@@ -48,6 +56,38 @@ def test_flatten_structs() -> None:
     flattened_df = _flatten_structs(df)
     assert "type.name" in flattened_df.columns
 
+
 def test_load_xml() -> None:
     df = _load_xml(XML_STR, root="root.events.event")
     assert df["x"][0] == "10"
+
+
+def test_load_xml_batches() -> None:
+    text = """
+    <root>
+      <event a="1" b="2"><k s="x"><p q="1"/></k></event>
+      <event a="3"><t t="z">text</t><k s="y" w="2"/></event>
+      <event a="4"><m/><n>1</n><n>2</n></event>
+      <event a="5"><m c="3"/></event>
+    </root>
+    """
+    expected = _flatten_structs(
+        pl.DataFrame(
+            xmltodict.parse(text)["root"]["event"], infer_schema_length=None
+        )
+    )
+    df = _load_xml(text, root="root.event", batch_size=2)
+    assert df.columns == expected.columns
+    assert df.equals(expected)
+
+
+@pytest.mark.parametrize(
+    ("source", "data_type"),
+    [(CSV_FILE, "csv"), (DATA_PATH / "sample.jsonl", "jsonl")],
+)
+def test_scan_df(source: Path, data_type: str) -> None:
+    provider = Provider(data_type=data_type, field_aliases={})
+    lf = _scan_df(source, provider)
+    assert isinstance(lf, pl.LazyFrame)
+    df = lf.filter(pl.col("type.name") == "Pass").collect()
+    assert df["x"].to_list() == [20]
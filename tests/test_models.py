@@ -5,7 +5,7 @@ import polars as pl
 import pytest
 
 from that_game import Records, expression, providers
-from that_game._loader import _load_df
+from that_game._loader import _load_df, _scan_df
 
 
 @pytest.fixture(scope="module")
@@ -31,6 +31,32 @@ class TestRecords:
         assert event["type"]["name"] == "Carry"
 
 
+class TestLazyRecords:
+    @pytest.fixture
+    def lazy_records(self, statsbomb_events_data: dict[str, Any]) -> Records:
+        lf = _scan_df(statsbomb_events_data, providers.statsbomb)
+        return Records(lf, providers.statsbomb)
+
+    def test_filter_stays_lazy(self, lazy_records: Records) -> None:
+        filtered = lazy_records.filter(period=expression.ge(2)).filter(
+            type="Shot"
+        )
+        assert filtered.lazy
+        assert len(filtered) == 1
+        assert filtered.to_dict()[0]["id"] == "4"
+        assert not filtered.lazy
+
+    def test_empty_result(self, lazy_records: Records) -> None:
+        filtered = lazy_records.filter(type="shot")
+        assert len(filtered) == 0
+
+    def test_drop_null_columns_collects(self, lazy_records: Records) -> None:
+        filtered = lazy_records.filter(type="Shot", drop_null_columns=True)
+        assert not filtered.lazy
+        with pytest.raises(ValueError):
+            lazy_records.filter(type="shot", drop_null_columns=True)
+
+
 class TestRecordsFilter:
     def test_eq(self, records: Records) -> None:
         shots = records.filter(type="Shot", id="4")